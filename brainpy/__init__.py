@@ -3,10 +3,11 @@
 __version__ = "2.1.0"
 
 
-try:
-  import jaxlib
-  del jaxlib
-except ModuleNotFoundError:
+import importlib as _importlib
+import importlib.util as _importlib_util
+
+# only locate "jaxlib", without executing it
+if _importlib_util.find_spec('jaxlib') is None:
   raise ModuleNotFoundError(
     'Please install jaxlib. See '
     'https://brainpy.readthedocs.io/en/latest/quickstart/installation.html#dependency-2-jax '
@@ -28,46 +29,95 @@ from .base.collector import Collector, TensorCollector
 from . import math
 
 
-# toolboxes
-from . import connect, initialize, optimizers, measure, losses, datasets, inputs
-
-
-# numerical integrators
-from . import integrators
-from .integrators import ode
-from .integrators import sde
-from .integrators import dde
-from .integrators.ode import odeint
-from .integrators.sde import sdeint
-from .integrators.dde import ddeint
-from .integrators.joint_eq import JointEq
-
-
-# dynamics simulation
-from . import dyn
-
-
-# neural networks modeling
-from . import nn
-
-
-# running
-from . import running
-
-
-# automatic dynamics analysis
-from . import analysis
-
-
-# "visualization" module, will be remove soon
-from .visualization import visualize
-
-
-# compatible interface
-from .compact import *  # compact
-
+# toolboxes which are always loaded, because
+# "brainpy.math" and "brainpy.tools" import them
+from . import connect, initialize, optimizers, losses
 
 # convenient access
 conn = connect
 init = initialize
 optim = optimizers
+
+
+# The following modules are loaded at their first access (PEP 562).
+_lazy_modules = {
+  # toolboxes
+  'measure': 'brainpy.measure',
+  'datasets': 'brainpy.datasets',
+  'inputs': 'brainpy.inputs',
+
+  # numerical integrators
+  'integrators': 'brainpy.integrators',
+  'ode': 'brainpy.integrators.ode',
+  'sde': 'brainpy.integrators.sde',
+  'dde': 'brainpy.integrators.dde',
+
+  # dynamics simulation
+  'dyn': 'brainpy.dyn',
+
+  # neural networks modeling
+  'nn': 'brainpy.nn',
+
+  # running
+  'running': 'brainpy.running',
+
+  # automatic dynamics analysis
+  'analysis': 'brainpy.analysis',
+
+  # "visualization" module, will be remove soon
+  'visualization': 'brainpy.visualization',
+
+  # compatible interface
+  'compact': 'brainpy.compact',
+  'brainobjects': 'brainpy.compact.brainobjects',
+  'layers': 'brainpy.compact.layers',
+  'models': 'brainpy.compact.models',
+}
+
+_lazy_attributes = {
+  # numerical integrators
+  'odeint': 'brainpy.integrators.ode',
+  'sdeint': 'brainpy.integrators.sde',
+  'ddeint': 'brainpy.integrators.dde',
+  'JointEq': 'brainpy.integrators.joint_eq',
+
+  # "visualization" module, will be remove soon
+  'visualize': 'brainpy.visualization',
+
+  # compatible interface
+  'DynamicalSystem': 'brainpy.compact',
+  'Container': 'brainpy.compact',
+  'Network': 'brainpy.compact',
+  'ConstantDelay': 'brainpy.compact',
+  'NeuGroup': 'brainpy.compact',
+  'TwoEndConn': 'brainpy.compact',
+  'set_default_odeint': 'brainpy.compact',
+  'set_default_sdeint': 'brainpy.compact',
+  'get_default_odeint': 'brainpy.compact',
+  'get_default_sdeint': 'brainpy.compact',
+  'Monitor': 'brainpy.compact',
+  'IntegratorRunner': 'brainpy.compact',
+  'DSRunner': 'brainpy.compact',
+  'StructRunner': 'brainpy.compact',
+  'ReportRunner': 'brainpy.compact',
+}
+
+__all__ = [
+  'errors', 'tools', 'base', 'Base', 'Collector', 'TensorCollector', 'math',
+  'connect', 'initialize', 'optimizers', 'losses', 'conn', 'init', 'optim',
+] + list(_lazy_modules) + list(_lazy_attributes)
+
+
+def __getattr__(name):
+  if name in _lazy_modules:
+    value = _importlib.import_module(_lazy_modules[name])
+  elif name in _lazy_attributes:
+    value = getattr(_importlib.import_module(_lazy_attributes[name]), name)
+  else:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_lazy_modules) | set(_lazy_attributes))
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
-import math as pm
 import warnings
 
+import jax
+import numpy as np
+
 import brainpy.math as bm
 from brainpy import tools
 from brainpy.base.base import Base
@@ -27,6 +29,75 @@ _error_msg = 'Unknown type of the update function: {} ({}). ' \
              '3. tuple/dict of functions \n' \
              '4. tuple of function names \n'
 
+# the cached names of integrators defined as the class attributes
+_class_integrators = dict()
+
+
+def _get_class_integrators(cls):
+  names = _class_integrators.get(cls, None)
+  if names is None:
+    names = tuple(k for k in dir(cls) if isinstance(getattr(cls, k, None), Integrator))
+    _class_integrators[cls] = names
+  return names
+
+
+def _wrap_delay_idx(idx, num_step):
+  # "idx" is increased by one at each step and is always smaller than
+  # "num_step", so that the modulo is replaced by a masked subtraction.
+  idx = idx + 1
+  return idx - (idx >= num_step).astype(idx.dtype) * num_step
+
+
+@jax.jit
+def _advance_delay_idx(in_idx, out_idx, num_step):
+  return _wrap_delay_idx(in_idx, num_step), _wrap_delay_idx(out_idx, num_step)
+
+
+@jax.jit
+def _advance_delays_idx(in_idxs, out_idxs, num_steps):
+  return ([_wrap_delay_idx(idx, n) for idx, n in zip(in_idxs, num_steps)],
+          [_wrap_delay_idx(idx, n) for idx, n in zip(out_idxs, num_steps)])
+
+
+def _update_delays(delays, _t=None, _dt=None):
+  # advance the indices of many "ConstantDelay" in one fused step
+  num_steps = [d.num_step if d.uniform_delay else d.num_step.value for d in delays]
+  in_idxs, out_idxs = _advance_delays_idx([d.in_idx.value for d in delays],
+                                          [d.out_idx.value for d in delays],
+                                          num_steps)
+  for d, in_idx, out_idx in zip(delays, in_idxs, out_idxs):
+    d.in_idx.value = in_idx
+    d.out_idx.value = out_idx
+
+
+def _conn_from_connector(conn, pre, post):
+  return conn(pre.size, post.size)
+
+
+def _conn_from_array(conn, pre, post):
+  if (pre.num, post.num) != conn.shape:
+    raise ModelBuildError(f'"conn" is provided as a matrix, and it is expected '
+                          f'to be an array with shape of (pre.num, post.num) = '
+                          f'{(pre.num, post.num)}, however we got {conn.shape}')
+  return MatConn(conn_mat=conn)
+
+
+def _conn_from_dict(conn, pre, post):
+  if not ('i' in conn and 'j' in conn):
+    raise ModelBuildError(f'"conn" is provided as a dict, and it is expected to '
+                          f'be a dictionary with "i" and "j" specification, '
+                          f'however we got {conn}')
+  return IJConn(i=conn['i'], j=conn['j'])
+
+
+# the handlers to build the connection of "TwoEndConn",
+# other types (subclasses of "TwoEndConnector", "bm.ndarray"
+# or "dict") are registered at their first usage
+_conn_handlers = {
+  dict: _conn_from_dict,
+  type(None): lambda conn, pre, post: None,
+}
+
 
 class DynamicalSystem(Base):
   """Base Dynamical System class.
@@ -65,7 +136,9 @@ class DynamicalSystem(Base):
     nodes = self.nodes(method=method)
     gather = Collector()
     for node_path, node in nodes.items():
-      for k in dir(node):
+      names = set(_get_class_integrators(type(node)))
+      names.update(k for k, v in node.__dict__.items() if isinstance(v, Integrator))
+      for k in sorted(names):
         v = getattr(node, k)
         if isinstance(v, Integrator):
           gather[f'{node_path}.{k}' if node_path else k] = v
@@ -180,36 +253,46 @@ class Container(DynamicalSystem):
     super(Container, self).__init__(name=name)
 
     # children dynamical systems
-    self.implicit_nodes = Collector()
-    for ds in ds_tuple:
+    all_ds = {}
+    for key, ds in [(None, ds) for ds in ds_tuple] + list(ds_dict.items()):
       if not isinstance(ds, DynamicalSystem):
         raise ModelBuildError(f'{self.__class__.__name__} receives instances of '
                               f'DynamicalSystem, however, we got {type(ds)}.')
-      if ds.name in self.implicit_nodes:
-        raise ValueError(f'{ds.name} has been paired with {ds}. Please change a unique name.')
-    self.register_implicit_nodes({node.name: node for node in ds_tuple})
-    for key, ds in ds_dict.items():
-      if not isinstance(ds, DynamicalSystem):
-        raise ModelBuildError(f'{self.__class__.__name__} receives instances of '
-                              f'DynamicalSystem, however, we got {type(ds)}.')
-      if key in self.implicit_nodes:
-        raise ValueError(f'{key} has been paired with {ds}. Please change a unique name.')
-    self.register_implicit_nodes(ds_dict)
+      if key is None:
+        key = ds.name
+      if key in all_ds and all_ds[key] is not ds:
+        raise ValueError(f'{key} has been paired with {all_ds[key]}. Please change a unique name.')
+      all_ds[key] = ds
+    self.register_implicit_nodes(all_ds)
 
   def update(self, _t, _dt):
     """Step function of a network.
 
     In this update function, the update functions in children systems are
     iteratively called.
+
+    .. note::
+       The index updates of all children :py:class:`ConstantDelay` (whose
+       ``update()`` is not overridden) are fused into one step, which is
+       called **after** all the other children systems, whatever the order
+       the delays are registered. Therefore, within one step, every child
+       system reads the delays before they are advanced.
     """
+    delays = []
     for node in self.child_ds().values():
-      node.update(_t, _dt)
+      if isinstance(node, ConstantDelay) and type(node).update is ConstantDelay.update:
+        delays.append(node)
+      else:
+        node.update(_t, _dt)
+    if len(delays):
+      _update_delays(delays, _t, _dt)
 
   def __getattr__(self, item):
-    child_ds = super(Container, self).__getattribute__('implicit_nodes')
-    if item in child_ds:
-      return child_ds[item]
-    else:
+    # "__getattr__" is only called when the normal attribute lookup fails,
+    # so that the children systems are directly searched in the instance dict.
+    try:
+      return self.__dict__['implicit_nodes'][item]
+    except KeyError:
       return super(Container, self).__getattribute__(item)
 
 
@@ -278,7 +361,7 @@ class ConstantDelay(DynamicalSystem):
     # data and operations
     if isinstance(delay, (int, float)):  # uniform delay
       self.uniform_delay = True
-      self.num_step = int(pm.ceil(delay / self.dt)) + 1
+      self.num_step = int(-(-delay / self.dt // 1)) + 1  # ceil(delay / dt) + 1
       self.out_idx = bm.Variable(bm.array([0], dtype=bm.uint32))
       self.in_idx = bm.Variable(bm.array([self.num_step - 1], dtype=bm.uint32))
       self.data = bm.Variable(bm.zeros((self.num_step,) + self.size, dtype=dtype))
@@ -297,12 +380,17 @@ class ConstantDelay(DynamicalSystem):
         raise ModelBuildError(f"The first shape of the delay time size must "
                               f"be the same with the delay data size. But "
                               f"we got {delay.shape[0]} != {self.size[0]}")
-      delay = bm.around(delay / self.dt)
-      self.diag = bm.array(bm.arange(self.num), dtype=bm.int_)
-      self.num_step = bm.array(delay, dtype=bm.uint32) + 1
-      self.in_idx = bm.Variable(self.num_step - 1)
+      # the delay length is computed on the host, because
+      # the maximum step is needed to get the data shape
+      num_step = np.asarray(np.around(bm.as_numpy(delay) / self.dt), dtype=np.uint32) + 1
+      max_step = int(num_step.max())
+      self.diag = bm.arange(self.num, dtype=bm.int_)
+      self.num_step = bm.asarray(num_step)
+      self.in_idx = bm.Variable(bm.asarray(num_step - 1))
       self.out_idx = bm.Variable(bm.zeros(self.num, dtype=bm.uint32))
-      self.data = bm.Variable(bm.zeros((self.num_step.max(),) + size, dtype=dtype))
+      # neuron-major layout "(num, max_step)" makes the per-neuron
+      # gather/scatter access contiguous along the neuron axis
+      self.data = bm.Variable(bm.zeros(self.size + (max_step,), dtype=dtype))
 
     super(ConstantDelay, self).__init__(**kwargs)
 
@@ -313,26 +401,32 @@ class ConstantDelay(DynamicalSystem):
   @property
   def latest(self):
     if self.uniform_delay:
-      return self.data[self.in_idx[0]]
+      return self.data[self.in_idx.value[0]]
     else:
-      return self.data[self.in_idx, self.diag]
+      return self._gather(self.in_idx)
 
   def pull(self):
     if self.uniform_delay:
-      return self.data[self.out_idx[0]]
+      return self.data[self.out_idx.value[0]]
     else:
-      return self.data[self.out_idx, self.diag]
+      return self._gather(self.out_idx)
 
   def push(self, value):
     if self.uniform_delay:
-      self.data[self.in_idx[0]] = value
+      self.data[self.in_idx.value[0]] = value
     else:
-      self.data[self.in_idx, self.diag] = value
+      self.data[self.diag, self.in_idx] = value
+
+  def _gather(self, idx):
+    # a single gather along the delay axis for the non-uniform delays
+    return bm.take_along_axis(self.data, bm.expand_dims(idx, 1), axis=1)[:, 0]
 
   def update(self, _t=None, _dt=None, **kwargs):
     """Update the delay index."""
-    self.in_idx[:] = (self.in_idx + 1) % self.num_step
-    self.out_idx[:] = (self.out_idx + 1) % self.num_step
+    num_step = self.num_step if self.uniform_delay else self.num_step.value
+    self.in_idx.value, self.out_idx.value = _advance_delay_idx(self.in_idx.value,
+                                                               self.out_idx.value,
+                                                               num_step)
 
   def reset(self):
     """Reset the variables."""
@@ -362,12 +456,14 @@ class NeuGroup(DynamicalSystem):
 
   def __init__(self, size, name=None):
     # size
-    if isinstance(size, (list, tuple)):
+    if type(size) is int:
+      size = (size,)
+    elif isinstance(size, (list, tuple)):
       if len(size) <= 0:
         raise ModelBuildError('size must be int, or a tuple/list of int.')
-      if not isinstance(size[0], int):
+      if not all(isinstance(s, int) for s in size):
         raise ModelBuildError('size must be int, or a tuple/list of int.')
-      size = tuple(size)
+      size = tuple(size)  # no copy for a tuple
     elif isinstance(size, int):
       size = (size,)
     else:
@@ -419,45 +515,39 @@ class TwoEndConn(DynamicalSystem):
 
     # connectivity
     # ------------
-    if isinstance(conn, TwoEndConnector):
-      self.conn = conn(pre.size, post.size)
-    elif isinstance(conn, bm.ndarray):
-      if (pre.num, post.num) != conn.shape:
-        raise ModelBuildError(f'"conn" is provided as a matrix, and it is expected '
-                              f'to be an array with shape of (pre.num, post.num) = '
-                              f'{(pre.num, post.num)}, however we got {conn.shape}')
-      self.conn = MatConn(conn_mat=conn)
-    elif isinstance(conn, dict):
-      if not ('i' in conn and 'j' in conn):
-        raise ModelBuildError(f'"conn" is provided as a dict, and it is expected to '
-                              f'be a dictionary with "i" and "j" specification, '
-                              f'however we got {conn}')
-      self.conn = IJConn(i=conn['i'], j=conn['j'])
-    elif conn is None:
-      self.conn = conn
-    else:
-      raise ModelBuildError(f'Unknown "conn" type: {conn}')
+    handler = _conn_handlers.get(type(conn), None)
+    if handler is None:
+      if isinstance(conn, TwoEndConnector):
+        handler = _conn_from_connector
+      elif isinstance(conn, bm.ndarray):
+        handler = _conn_from_array
+      elif isinstance(conn, dict):
+        handler = _conn_from_dict
+      else:
+        raise ModelBuildError(f'Unknown "conn" type: {conn}')
+      _conn_handlers[type(conn)] = handler
+    self.conn = handler(conn, pre, post)
 
     # initialize
     # ----------
     super(TwoEndConn, self).__init__(name=name)
 
-  def check_pre_attrs(self, *attrs):
-    """Check whether pre group satisfies the requirement."""
-    if not hasattr(self, 'pre'):
+  def _check_group_attrs(self, key, attrs):
+    if key not in self.__dict__:
       raise ModelBuildError('Please call __init__ function first.')
+    group = self.__dict__[key]
     for attr in attrs:
       if not isinstance(attr, str):
         raise ValueError(f'Must be string. But got {attr}.')
-      if not hasattr(self.pre, attr):
-        raise ModelBuildError(f'{self} need "pre" neuron group has attribute "{attr}".')
+    # the instance dict is checked first to avoid the fallback of "__getattr__"
+    missing = [attr for attr in attrs if not (attr in group.__dict__ or hasattr(group, attr))]
+    if len(missing):
+      raise ModelBuildError(f'{self} need "{key}" neuron group has attributes {missing}.')
+
+  def check_pre_attrs(self, *attrs):
+    """Check whether pre group satisfies the requirement."""
+    self._check_group_attrs('pre', attrs)
 
   def check_post_attrs(self, *attrs):
     """Check whether post group satisfies the requirement."""
-    if not hasattr(self, 'post'):
-      raise ModelBuildError('Please call __init__ function first.')
-    for attr in attrs:
-      if not isinstance(attr, str):
-        raise ValueError(f'Must be string. But got {attr}.')
-      if not hasattr(self.post, attr):
-        raise ModelBuildError(f'{self} need "pre" neuron group has attribute "{attr}".')
+    self._check_group_attrs('post', attrs)
@@ -206,7 +206,9 @@ class HH(NeuGroup):
     self.integral = odeint(method=method, f=self.derivative)
 
   def dm(self, m, t, V):
-    alpha = 0.1 * (V + 40) / (1 - bm.exp(-(V + 40) / 10))
+    V40 = V + 40
+    # "1 - exp(-x)" is computed by "-expm1(-x)" to avoid the cancellation
+    alpha = -0.1 * V40 / bm.expm1(-V40 / 10)
     beta = 4.0 * bm.exp(-(V + 65) / 18)
     dmdt = alpha * (1 - m) - beta * m
     return dmdt
@@ -218,14 +220,16 @@ class HH(NeuGroup):
     return dhdt
 
   def dn(self, n, t, V):
-    alpha = 0.01 * (V + 55) / (1 - bm.exp(-(V + 55) / 10))
+    V55 = V + 55
+    alpha = -0.01 * V55 / bm.expm1(-V55 / 10)
     beta = 0.125 * bm.exp(-(V + 65) / 80)
     dndt = alpha * (1 - n) - beta * n
     return dndt
 
   def dV(self, V, t, m, h, n, I_ext):
-    I_Na = (self.gNa * m ** 3.0 * h) * (V - self.ENa)
-    I_K = (self.gK * n ** 4.0) * (V - self.EK)
+    n2 = n * n
+    I_Na = (self.gNa * m * m * m * h) * (V - self.ENa)
+    I_K = (self.gK * n2 * n2) * (V - self.EK)
     I_leak = self.gL * (V - self.EL)
     dVdt = (- I_Na - I_K - I_leak + I_ext) / self.C
     return dVdt
@@ -235,14 +239,17 @@ class HH(NeuGroup):
     return JointEq([self.dV, self.dm, self.dh, self.dn])
 
   def update(self, _t, _dt):
-    V, m, h, n = self.integral(self.V, self.m, self.h, self.n, _t, self.input, dt=_dt)
-    self.spike.value = bm.logical_and(self.V < self.V_th, V >= self.V_th)
-    self.t_last_spike.value = bm.where(self.spike, _t, self.t_last_spike)
+    V_old = self.V.value
+    V, m, h, n = self.integral(V_old, self.m.value, self.h.value, self.n.value,
+                               _t, self.input.value, dt=_dt)
+    spike = bm.logical_and(V_old < self.V_th, V >= self.V_th)
+    self.t_last_spike.value = bm.where(spike, _t, self.t_last_spike.value)
+    self.spike.value = spike
     self.V.value = V
     self.m.value = m
     self.h.value = h
     self.n.value = n
-    self.input[:] = 0.
+    self.input.value = bm.zeros_like(self.input)
 
 
 class MorrisLecar(NeuGroup):
@@ -374,8 +381,12 @@ class MorrisLecar(NeuGroup):
     return dVdt
 
   def dW(self, W, t, V):
-    tau_W = 1 / (self.phi * bm.cosh((V - self.V3) / (2 * self.V4)))
-    W_inf = (1 / 2) * (1 + bm.tanh((V - self.V3) / self.V4))
+    # "cosh(x)" and "(1 + tanh(2x)) / 2" share one exponential "exp(x)",
+    # where x = (V - V3) / (2 * V4)
+    e = bm.exp((V - self.V3) / (2 * self.V4))
+    e2 = e * e
+    tau_W = 2 / (self.phi * (e + 1 / e))
+    W_inf = 1 / (1 + 1 / (e2 * e2))
     dWdt = (W_inf - W) / tau_W
     return dWdt
 
@@ -384,9 +395,10 @@ class MorrisLecar(NeuGroup):
     return JointEq([self.dV, self.dW])
 
   def update(self, _t, _dt):
-    V, self.W.value = self.integral(self.V, self.W, _t, self.input, dt=_dt)
-    spike = bm.logical_and(self.V < self.V_th, V >= self.V_th)
-    self.t_last_spike.value = bm.where(spike, _t, self.t_last_spike)
+    V_old = self.V.value
+    V, self.W.value = self.integral(V_old, self.W.value, _t, self.input.value, dt=_dt)
+    spike = bm.logical_and(V_old < self.V_th, V >= self.V_th)
+    self.t_last_spike.value = bm.where(spike, _t, self.t_last_spike.value)
     self.V.value = V
     self.spike.value = spike
-    self.input[:] = 0.
+    self.input.value = bm.zeros_like(self.input)
@@ -40,3 +40,64 @@ def test_constant_delay_nonuniform_no_batch1():
   a = cd.pull()
   print(a)
   print(type(a))
+
+
+def test_constant_delay_nonuniform_values():
+  rng = np.random.RandomState(1234)
+  delays = rng.random(10) * 3 + 0.2
+
+  cd = ConstantDelay(size=10, delay=delays, dt=0.1)
+  assert cd.data.shape == (10, int(cd.num_step.max()))
+  num_step = np.asarray(cd.num_step.value, dtype=np.int64)
+  for i in range(50):
+    cd.push(bm.ones(cd.size) * i)
+    expected = np.maximum(i - (num_step - 1), 0)
+    assert np.allclose(np.asarray(cd.pull()), expected)
+    cd.update(0, 0)
+
+
+def test_constant_delay_fused_update_in_network():
+  from brainpy.dyn.base import Network
+
+  rng = np.random.RandomState(1234)
+  cd1 = ConstantDelay(size=10, delay=2, dt=0.1)
+  cd2 = ConstantDelay(size=10, delay=rng.random(10) * 3 + 0.2, dt=0.1)
+  net = Network(cd1, cd2)
+  for i in range(25):
+    net.update(0, 0)
+    assert np.asarray(cd1.out_idx)[0] == (i + 1) % cd1.num_step
+    assert np.all(np.asarray(cd2.out_idx) == (i + 1) % np.asarray(cd2.num_step))
+
+
+def test_constant_delay_updated_after_other_children():
+  from brainpy.dyn.base import DynamicalSystem, Network
+
+  class Reader(DynamicalSystem):
+    def __init__(self, delay):
+      super(Reader, self).__init__()
+      self.delay = delay
+      self.seen = []
+
+    def update(self, _t, _dt):
+      self.seen.append(int(np.asarray(self.delay.out_idx)[0]))
+
+  cd = ConstantDelay(size=10, delay=2, dt=0.1)
+  reader = Reader(cd)
+  # the delay is registered first, but it is advanced after the reader
+  net = Network(cd, reader)
+  for i in range(5):
+    net.update(0, 0)
+  assert reader.seen == [i % cd.num_step for i in range(5)]
+
+
+def test_constant_delay_added_after_first_update():
+  from brainpy.dyn.base import Network
+
+  cd1 = ConstantDelay(size=10, delay=2, dt=0.1)
+  cd2 = ConstantDelay(size=10, delay=2, dt=0.1)
+  net = Network(cd1)
+  net.update(0, 0)
+  net.implicit_nodes['cd2'] = cd2
+  net.update(0, 0)
+  assert np.asarray(cd1.out_idx)[0] == 2
+  assert np.asarray(cd2.out_idx)[0] == 1
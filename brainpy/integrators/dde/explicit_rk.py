@@ -43,12 +43,6 @@ class ExplicitRKIntegrator(DDEIntegrator):
         keywords[f'k{i}_{v}_arg'] = 'the intermediate value'
         keywords[f'k{i}_t_arg'] = 'the intermediate value'
     check_kws(self.arguments, keywords)
-
-    def integral(*vars, **kwargs):
-      pass
-
-
-
     self.build()
 
   def build(self):
@@ -85,9 +79,9 @@ class Heun2(ExplicitRKIntegrator):
 
 
 class Ralston2(ExplicitRKIntegrator):
-  A = [(), ('2/3',)]
+  A = [(), (2 / 3,)]
   B = [0.25, 0.75]
-  C = [0, '2/3']
+  C = [0, 2 / 3]
 
 
 class RK2(ExplicitRKIntegrator):
@@ -100,31 +94,31 @@ class RK2(ExplicitRKIntegrator):
 
 class RK3(ExplicitRKIntegrator):
   A = [(), (0.5,), (-1, 2)]
-  B = ['1/6', '2/3', '1/6']
+  B = [1 / 6, 2 / 3, 1 / 6]
   C = [0, 0.5, 1]
 
 
 class Heun3(ExplicitRKIntegrator):
-  A = [(), ('1/3',), (0, '2/3')]
+  A = [(), (1 / 3,), (0, 2 / 3)]
   B = [0.25, 0, 0.75]
-  C = [0, '1/3', '2/3']
+  C = [0, 1 / 3, 2 / 3]
 
 
 class Ralston3(ExplicitRKIntegrator):
   A = [(), (0.5,), (0, 0.75)]
-  B = ['2/9', '1/3', '4/9']
+  B = [2 / 9, 1 / 3, 4 / 9]
   C = [0, 0.5, 0.75]
 
 
 class SSPRK3(ExplicitRKIntegrator):
   A = [(), (1,), (0.25, 0.25)]
-  B = ['1/6', '1/6', '2/3']
+  B = [1 / 6, 1 / 6, 2 / 3]
   C = [0, 1, 0.5]
 
 
 class RK4(ExplicitRKIntegrator):
   A = [(), (0.5,), (0., 0.5), (0., 0., 1)]
-  B = ['1/6', '1/3', '1/3', '1/6']
+  B = [1 / 6, 1 / 3, 1 / 3, 1 / 6]
   C = [0, 0.5, 0.5, 1]
 
 
@@ -135,6 +129,6 @@ class Ralston4(ExplicitRKIntegrator):
 
 
 class RK4Rule38(ExplicitRKIntegrator):
-  A = [(), ('1/3',), ('-1/3', '1'), (1, -1, 1)]
+  A = [(), (1 / 3,), (-1 / 3, 1), (1, -1, 1)]
   B = [0.125, 0.375, 0.375, 0.125]
-  C = [0, '1/3', '2/3', 1]
+  C = [0, 1 / 3, 2 / 3, 1]
@@ -42,12 +42,23 @@ def step(vars, dt_var, A, C, code_lines, other_args):
 
 
 def update(vars, dt_var, B, code_lines):
+  # "dt" is factored out of the weighted sum of the stages, i.e.,
+  # "x_new = x + dt * (dx_k1 * b1 + dx_k2 * b2 + ...)"
   return_args = []
   for v in vars:
-    result = v
+    terms = []
     for i, b1 in enumerate(B):
       if b1 not in [0., '0.', '0']:
-        result += f' + d{v}_k{i + 1} * {dt_var} * {b1}'
+        if b1 in ['1.0', '1.', '1', 1.]:
+          terms.append(f'd{v}_k{i + 1}')
+        else:
+          terms.append(f'd{v}_k{i + 1} * ({b1})' if isinstance(b1, str) else f'd{v}_k{i + 1} * {b1}')
+    if len(terms) == 0:
+      result = v
+    elif len(terms) == 1:
+      result = f'{v} + {dt_var} * {terms[0]}'
+    else:
+      result = f'{v} + {dt_var} * ({" + ".join(terms)})'
     code_lines.append(f'  {v}_new = {result}')
     return_args.append(f'{v}_new')
   return return_args
@@ -87,6 +87,9 @@ __all__ = [
   'RK4Rule38',
 ]
 
+_FUNC_NAME = '_rk_integral'
+_compiled_codes = {}
+
 
 class ExplicitRKIntegrator(ODEIntegrator):
   r"""Explicit Runge–Kutta methods for ordinary differential equation.
@@ -159,11 +162,27 @@ class ExplicitRKIntegrator(ODEIntegrator):
     # returns
     self.code_lines.append(f'  return {", ".join(return_args)}')
     # compile
-    self.integral = utils.compile_code(
-      code_scope={k: v for k, v in self.code_scope.items()},
-      code_lines=self.code_lines,
-      show_code=self.show_code,
-      func_name=self.func_name)
+    if self.show_code:
+      self.integral = utils.compile_code(
+        code_scope={k: v for k, v in self.code_scope.items()},
+        code_lines=self.code_lines,
+        show_code=self.show_code,
+        func_name=self.func_name)
+    else:
+      # The generated code only depends on the Butcher tableau and the
+      # function signature, so its compilation is shared by the integrators
+      # of the same method (only the derivative "f" in the scope differs).
+      key = (tuple(self.arguments), tuple(self.code_lines[1:]))
+      code = _compiled_codes.get(key)
+      if code is None:
+        code_lines = [f'def {_FUNC_NAME}({", ".join(self.arguments)}):'] + self.code_lines[1:]
+        code = compile('\n'.join(code_lines), '', 'exec')
+        _compiled_codes[key] = code
+      code_scope = {k: v for k, v in self.code_scope.items()}
+      exec(code, code_scope)
+      integral = code_scope[_FUNC_NAME]
+      integral.__name__ = integral.__qualname__ = self.func_name
+      self.integral = integral
 
 
 class Euler(ExplicitRKIntegrator):
@@ -432,9 +451,9 @@ class Ralston2(ExplicitRKIntegrator):
           \hline & 1 / 4 & 3 / 4
       \end{array}
   """
-  A = [(), ('2/3',)]
+  A = [(), (2 / 3,)]
   B = [0.25, 0.75]
-  C = [0, '2/3']
+  C = [0, 2 / 3]
 
 
 class RK2(ExplicitRKIntegrator):
@@ -594,7 +613,7 @@ class RK3(ExplicitRKIntegrator):
 
   """
   A = [(), (0.5,), (-1, 2)]
-  B = ['1/6', '2/3', '1/6']
+  B = [1 / 6, 2 / 3, 1 / 6]
   C = [0, 0.5, 1]
 
 
@@ -617,9 +636,9 @@ class Heun3(ExplicitRKIntegrator):
       \end{array}
 
   """
-  A = [(), ('1/3',), (0, '2/3')]
+  A = [(), (1 / 3,), (0, 2 / 3)]
   B = [0.25, 0, 0.75]
-  C = [0, '1/3', '2/3']
+  C = [0, 1 / 3, 2 / 3]
 
 
 class Ralston3(ExplicitRKIntegrator):
@@ -647,7 +666,7 @@ class Ralston3(ExplicitRKIntegrator):
 
   """
   A = [(), (0.5,), (0, 0.75)]
-  B = ['2/9', '1/3', '4/9']
+  B = [2 / 9, 1 / 3, 4 / 9]
   C = [0, 0.5, 0.75]
 
 
@@ -670,7 +689,7 @@ class SSPRK3(ExplicitRKIntegrator):
 
   """
   A = [(), (1,), (0.25, 0.25)]
-  B = ['1/6', '1/6', '2/3']
+  B = [1 / 6, 1 / 6, 2 / 3]
   C = [0, 1, 0.5]
 
 
@@ -737,7 +756,7 @@ class RK4(ExplicitRKIntegrator):
   """
 
   A = [(), (0.5,), (0., 0.5), (0., 0., 1)]
-  B = ['1/6', '1/3', '1/3', '1/6']
+  B = [1 / 6, 1 / 3, 1 / 3, 1 / 6]
   C = [0, 0.5, 0.5, 1]
 
 
@@ -808,6 +827,6 @@ class RK4Rule38(ExplicitRKIntegrator):
          Berlin, New York: Springer-Verlag, ISBN 978-3-540-56670-0.
 
   """
-  A = [(), ('1/3',), ('-1/3', '1'), (1, -1, 1)]
+  A = [(), (1 / 3,), (-1 / 3, 1), (1, -1, 1)]
   B = [0.125, 0.375, 0.375, 0.125]
-  C = [0, '1/3', '2/3', 1]
+  C = [0, 1 / 3, 2 / 3, 1]
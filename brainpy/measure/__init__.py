@@ -18,13 +18,6 @@ __all__ = [
 ]
 
 
-# @tools.numba_jit
-def _cc(states, i, j):
-  sqrt_ij = np.sqrt(np.sum(states[i]) * np.sum(states[j]))
-  k = 0. if sqrt_ij == 0. else np.sum(states[i] * states[j]) / sqrt_ij
-  return k
-
-
 def cross_correlation(spikes, bin, dt=None):
   r"""Calculate cross correlation index between neurons.
 
@@ -70,21 +63,22 @@ def cross_correlation(spikes, bin, dt=None):
   dt = math.get_dt() if dt is None else dt
   bin_size = int(bin / dt)
   num_hist, num_neu = spikes.shape
-  num_bin = int(np.ceil(num_hist / bin_size))
-  if num_bin * bin_size != num_hist:
-    spikes = np.append(spikes, np.zeros((num_bin * bin_size - num_hist, num_neu)), axis=0)
-  states = spikes.T.reshape((num_neu, num_bin, bin_size))
-  states = (np.sum(states, axis=2) > 0.).astype(np.float_)
-  all_k = []
-  for i in range(num_neu):
-    for j in range(i + 1, num_neu):
-      all_k.append(_cc(states, i, j))
-  return np.mean(all_k)
-
-
-# @tools.numba_jit
-def _var(neu_signal):
-  return np.mean(neu_signal * neu_signal) - np.mean(neu_signal) ** 2
+  # whether each bin (the last one may be incomplete) has a spike,
+  # computed as a logical "or" over one-byte boolean spikes
+  if spikes.dtype != np.bool_:
+    spikes = spikes > 0.
+  binned = np.logical_or.reduceat(spikes, np.arange(0, num_hist, bin_size), axis=0)
+  states = binned.T.astype(np.float32)
+  # The coherence of all pairs is computed with one matrix product. The
+  # products of the 0/1 states are integer counts, which are exact in
+  # float32, so only the normalization is done in float64.
+  sums = np.sum(states, axis=1, dtype=np.float_)
+  sqrt_ij = np.sqrt(np.outer(sums, sums))
+  products = (states @ states.T).astype(np.float_)
+  all_k = np.divide(products, sqrt_ij, out=np.zeros_like(products), where=sqrt_ij != 0.)
+  # "all_k" is symmetric, so the mean over the pairs (i < j) is
+  # obtained from the whole sum without gathering the upper triangle
+  return (np.sum(all_k) - np.trace(all_k)) / (num_neu * (num_neu - 1))
 
 
 def voltage_fluctuation(potentials):
@@ -145,11 +139,12 @@ def voltage_fluctuation(potentials):
   potentials = np.asarray(potentials)
   num_hist, num_neu = potentials.shape
   avg = np.mean(potentials, axis=1)
-  avg_var = np.mean(avg * avg) - np.mean(avg) ** 2
-  neu_vars = []
-  for i in range(num_neu):
-    neu_vars.append(_var(potentials[:, i]))
-  var_mean = np.mean(neu_vars)
+  avg_var = np.dot(avg, avg) / num_hist - np.mean(avg) ** 2
+  # the variances of all neurons in one pass, without
+  # allocating the squared potential matrix
+  m1 = np.mean(potentials, axis=0)
+  m2 = np.einsum('ij,ij->j', potentials, potentials) / num_hist
+  var_mean = np.mean(m2 - m1 * m1)
   return avg_var / var_mean if var_mean != 0. else 1.
 
 
@@ -171,9 +166,10 @@ def raster_plot(sp_matrix, times):
   """
   sp_matrix = np.asarray(sp_matrix)
   times = np.asarray(times)
-  elements = np.where(sp_matrix > 0.)
-  index = elements[1]
-  time = times[elements[0]]
+  # boolean spike matrices are used directly as the mask
+  mask = sp_matrix if sp_matrix.dtype == np.bool_ else (sp_matrix > 0.)
+  rows, index = np.nonzero(mask)
+  time = times[rows]
   return index, time
 
 
@@ -207,5 +203,14 @@ def firing_rate(sp_matrix, width, dt=None):
   rate = np.sum(sp_matrix, axis=1) / sp_matrix.shape[1]
   dt = math.get_dt() if dt is None else dt
   width1 = int(width / 2 / dt) * 2 + 1
-  window = np.ones(width1) * 1000 / width
-  return np.convolve(rate, window, mode='same')
+  if width1 < 64 or width1 > rate.size:
+    window = np.ones(width1) * 1000 / width
+    return np.convolve(rate, window, mode='same')
+  # For a wide flat window, the convolution is the moving
+  # sum, which is computed in O(T) with the cumulative sum.
+  half = width1 // 2
+  cum_rate = np.concatenate([np.zeros(1), np.cumsum(rate)])
+  idx = np.arange(rate.size)
+  high = np.minimum(idx + half + 1, rate.size)
+  low = np.maximum(idx - half, 0)
+  return (cum_rate[high] - cum_rate[low]) * (1000 / width)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+import brainpy as bp
+
+
+def _naive_cross_correlation(spikes, bin, dt):
+  bin_size = int(bin / dt)
+  num_hist, num_neu = spikes.shape
+  num_bin = int(np.ceil(num_hist / bin_size))
+  if num_bin * bin_size != num_hist:
+    spikes = np.append(spikes, np.zeros((num_bin * bin_size - num_hist, num_neu)), axis=0)
+  states = spikes.T.reshape((num_neu, num_bin, bin_size))
+  states = (np.sum(states, axis=2) > 0.).astype(float)
+  all_k = []
+  for i in range(num_neu):
+    for j in range(i + 1, num_neu):
+      sqrt_ij = np.sqrt(np.sum(states[i]) * np.sum(states[j]))
+      all_k.append(0. if sqrt_ij == 0. else np.sum(states[i] * states[j]) / sqrt_ij)
+  return np.mean(all_k)
+
+
+def test_cross_correlation():
+  rng = np.random.RandomState(123)
+  for num_hist in [1000, 997]:
+    spikes = (rng.random((num_hist, 20)) < 0.02).astype(float)
+    spikes[:, 0] = 0.  # a silent neuron
+    for bin in [0.5, 1., 2.3]:
+      assert np.allclose(bp.measure.cross_correlation(spikes, bin, dt=0.1),
+                         _naive_cross_correlation(spikes, bin, dt=0.1))
+
+
+def test_voltage_fluctuation():
+  rng = np.random.RandomState(123)
+  potentials = rng.normal(-60., 5., (1000, 20))
+  avg = np.mean(potentials, axis=1)
+  neu_vars = [np.var(potentials[:, i]) for i in range(potentials.shape[1])]
+  assert np.allclose(bp.measure.voltage_fluctuation(potentials), np.var(avg) / np.mean(neu_vars))
+
+
+def test_firing_rate():
+  rng = np.random.RandomState(123)
+  sp_matrix = (rng.random((5000, 50)) < 0.05).astype(float)
+  rate = np.mean(sp_matrix, axis=1)
+  for width in [2., 20., 100.]:
+    width1 = int(width / 2 / 0.1) * 2 + 1
+    expected = np.convolve(rate, np.ones(width1) * 1000 / width, mode='same')
+    assert np.allclose(bp.measure.firing_rate(sp_matrix, width, dt=0.1), expected)
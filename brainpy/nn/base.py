@@ -16,6 +16,7 @@ This module provide basic Node class for whole ``brainpy.nn`` system.
 """
 
 from copy import copy, deepcopy
+from itertools import chain
 from typing import (Dict, Sequence, Tuple, Union, Optional, Any, Callable)
 
 import jax.numpy as jnp
@@ -68,6 +69,16 @@ def not_implemented(fun: Callable) -> Callable:
   return fun
 
 
+def _copy_mutable(shapes):
+  # the passed shapes are cached on the node, so a dict or a list
+  # is copied to keep the cache safe from mutations by the caller
+  if isinstance(shapes, dict):
+    return dict(shapes)
+  if isinstance(shapes, list):
+    return list(shapes)
+  return shapes
+
+
 class Node(Base):
   """Basic Node class for neural network building in BrainPy."""
 
@@ -89,6 +100,8 @@ class Node(Base):
     self._feedforward_shapes = None  # input shapes
     self._output_shape = None  # output size
     self._feedback_shapes = None  # feedback shapes
+    self._passed_ff_shapes = None  # input shapes after the data pass
+    self._passed_fb_shapes = None  # feedback shapes after the data pass
     self._is_ff_initialized = False
     self._is_fb_initialized = False
     self._is_state_initialized = False
@@ -106,6 +119,7 @@ class Node(Base):
     # parameters
     if input_shape is not None:
       self._feedforward_shapes = {self.name: (None,) + tools.to_size(input_shape)}
+      self._passed_ff_shapes = self.data_pass_func(self._feedforward_shapes)
 
   def __repr__(self):
     name = type(self).__name__
@@ -261,7 +275,7 @@ class Node(Base):
   @property
   def feedforward_shapes(self):
     """Input data size."""
-    return self.data_pass_func(self._feedforward_shapes)
+    return _copy_mutable(self._passed_ff_shapes)
 
   @feedforward_shapes.setter
   def feedforward_shapes(self, size):
@@ -274,6 +288,7 @@ class Node(Base):
                       val_type=(list, tuple),
                       name='feedforward_shapes')
       self._feedforward_shapes = feedforward_shapes
+      self._passed_ff_shapes = self.data_pass_func(feedforward_shapes)
     else:
       if self.feedforward_shapes is not None:
         for key, size in self._feedforward_shapes.items():
@@ -289,7 +304,7 @@ class Node(Base):
   @property
   def feedback_shapes(self):
     """Output data size."""
-    return self.data_pass_func(self._feedback_shapes)
+    return _copy_mutable(self._passed_fb_shapes)
 
   @feedback_shapes.setter
   def feedback_shapes(self, size):
@@ -299,16 +314,17 @@ class Node(Base):
     if not self.is_fb_initialized:
       check_dict_data(fb_shapes, key_type=(Node, str), val_type=(tuple, list), name='fb_shapes')
       self._feedback_shapes = fb_shapes
+      self._passed_fb_shapes = self.data_pass_func(fb_shapes)
     else:
       if self.feedback_shapes is not None:
-        for key, size in self._feedforward_shapes.items():
+        for key, size in self._feedback_shapes.items():
           if key not in fb_shapes:
-            raise ValueError(f"Impossible to reset the input data of {self.name}. "
-                             f"Because this Node has the input dimension {size} from {key}. "
+            raise ValueError(f"Impossible to reset the feedback data of {self.name}. "
+                             f"Because this Node has the feedback dimension {size} from {key}. "
                              f"While we do not find it in {fb_shapes}")
           if not check_batch_shape(size, fb_shapes[key], mode='bool'):
-            raise ValueError(f"Impossible to reset the input data of {self.name}. "
-                             f"Because this Node has the input dimension {size} from {key}. "
+            raise ValueError(f"Impossible to reset the feedback data of {self.name}. "
+                             f"Because this Node has the feedback dimension {size} from {key}. "
                              f"While the give shape is {fb_shapes[key]}")
 
   @property
@@ -364,7 +380,10 @@ class Node(Base):
     if shallow:
       new_obj = copy(self)
     else:
-      new_obj = deepcopy(self)
+      # JAX arrays are immutable, so the copied variables can share
+      # their data buffers, only the Python objects are duplicated
+      memo = {id(v.value): v.value for v in self.vars(level=-1).values()}
+      new_obj = deepcopy(self, memo)
     new_obj.name = self.unique_name(name or (self.name + '_copy'))
     return new_obj
 
@@ -422,7 +441,7 @@ class Node(Base):
         assert isinstance(ff, dict), f'"ff" must be a dict or a tensor, got {type(ff)}: {ff}'
         assert self.name in ff, f'Cannot find input for this node \n\n{self} \n\nwhen given "ff" {ff}'
         batch_sizes = [v.shape[0] for v in ff.values()]
-        if set(batch_sizes) != 1:
+        if any(b != batch_sizes[0] for b in batch_sizes):
           raise ValueError('Batch sizes must be consistent, but we got multiple '
                            f'batch sizes {set(batch_sizes)} for the given input: \n'
                            f'{ff}')
@@ -467,7 +486,7 @@ class Node(Base):
 
     # data
     ff = self.data_pass_func(ff)
-    fb = self.data_pass_func(fb)
+    fb = None if fb is None else self.data_pass_func(fb)
     return ff, fb
 
   def _call(self,
@@ -610,10 +629,10 @@ class RecurrentNode(Node):
         raise MathError('Cannot set the state, because the dtype is not consistent: '
                         f'{self.state.dtype} != {state.dtype}')
       if self.state_trainable:
-        # get the batch size information
-        state = bm.repeat(bm.expand_dims(self.train_state, axis=0), state.shape[0], axis=0)
+        # all batch states start from the trainable state
+        state = jnp.broadcast_to(self.train_state.value, state.shape)
         # set the state
-        self.state._value = bm.as_device_array(state)
+        self.state._value = state
       else:
         self.state._value = bm.as_device_array(state)
 
@@ -665,12 +684,30 @@ class Network(Node):
     self._ff_senders, self._ff_receivers = find_senders_and_receivers(self._ff_edges)
     # build feedback connection graph
     self._fb_senders, self._fb_receivers = find_senders_and_receivers(self._fb_edges)
+    # the running order of the non-entry nodes, in which
+    # each node comes after all of its feedforward senders
+    self._ff_order = self._find_ff_order()
     # register nodes for brainpy.Base object
     self.implicit_nodes = Collector({n.name: n for n in self._nodes})
     # set initialization states
     self._is_initialized = False
     self._is_fb_initialized = False
 
+  def _find_ff_order(self):
+    num_senders = {node: len(senders) for node, senders in self._ff_senders.items()}
+    order = []
+    queue = list(self._entry_nodes)
+    i = 0
+    while i < len(queue):
+      node = queue[i]
+      i += 1
+      for child in self._ff_receivers.get(node, []):
+        num_senders[child] -= 1
+        if num_senders[child] == 0:
+          queue.append(child)
+          order.append(child)
+    return tuple(order)
+
   def __repr__(self):
     return f"{type(self).__name__}({', '.join([n.name for n in self._nodes])})"
 
@@ -709,12 +746,12 @@ class Network(Node):
   @property
   def trainable(self) -> bool:
     """Returns True if at least one Node in the Model is trainable."""
-    return any([n.trainable for n in self.lnodes])
+    return any(n.trainable for n in self.lnodes)
 
   @trainable.setter
   def trainable(self, value: bool):
     """Freeze or unfreeze trainable Nodes in the Model."""
-    for node in [n for n in self.lnodes]:
+    for node in self.lnodes:
       node.trainable = value
 
   @property
@@ -791,9 +828,10 @@ class Network(Node):
         The updated network.
     """
     if new_fb_edges is None: new_fb_edges = tuple()
-    self._nodes = tuple(set(new_nodes) | set(self.lnodes))
-    self._ff_edges = tuple(set(new_ff_edges) | set(self.ff_edges))
-    self._fb_edges = tuple(set(new_fb_edges) | set(self.fb_edges))
+    # merge without duplicates, keeping the existing order first
+    self._nodes = tuple(dict.fromkeys(chain(self.lnodes, new_nodes)))
+    self._ff_edges = tuple(dict.fromkeys(chain(self.ff_edges, new_ff_edges)))
+    self._fb_edges = tuple(dict.fromkeys(chain(self.fb_edges, new_fb_edges)))
     # detect cycles in the graph flow
     if detect_cycle(self._nodes, self._ff_edges):
       raise ValueError('We detect cycles in feedforward connections. '
@@ -828,27 +866,12 @@ class Network(Node):
           node.set_feedforward_shapes({node.name: self._feedforward_shapes[node.name]})
       node._ff_init()
 
-    # initialize the data
-    children_queue = []
-    ff_senders, _ = find_senders_and_receivers(self.ff_edges)
-
     # init shapes of other nodes
-    for node in self._entry_nodes:
-      for child in self.ff_receivers.get(node, []):
-        ff_senders[child].remove(node)
-        if len(ff_senders.get(child, [])) == 0:
-          children_queue.append(child)
-    while len(children_queue):
-      node = children_queue.pop(0)
+    for node in self._ff_order:
       # initialize input and output sizes
       parent_sizes = {p: p.output_shape for p in self.ff_senders.get(node, [])}
       node.set_feedforward_shapes(parent_sizes)
       node._ff_init()
-      # append children
-      for child in self.ff_receivers.get(node, []):
-        ff_senders[child].remove(node)
-        if len(ff_senders.get(child, [])) == 0:
-          children_queue.append(child)
 
   def init_fb(self):
     for receiver, senders in self.fb_senders.items():
@@ -882,10 +905,10 @@ class Network(Node):
                                         f"{self} "
                                         f"\n\nhas no output nodes.")
 
-      # check whether has a feedforward path for each feedback pair
-      ff_edges = [(a.name, b.name) for a, b in self.ff_edges]
+      # check whether has a feedforward path for each feedback pair,
+      # searched in the receiver dict which is built with the graph
       for node, receiver in self.fb_edges:
-        if not detect_path(receiver.name, node.name, ff_edges):
+        if not detect_path(receiver, node, self.ff_receivers):
           raise ValueError(f'Cannot build a feedback connection from '
                            f'\n\n{node} \n\n'
                            f'to '
@@ -916,7 +939,7 @@ class Network(Node):
           if n.name not in ff:
             raise ValueError(f'Cannot find the input of the node {n}')
         batch_sizes = [v.shape[0] for v in ff.values()]
-        if len(set(batch_sizes)) != 1:
+        if any(b != batch_sizes[0] for b in batch_sizes):
           raise ValueError('Batch sizes must be consistent, but we got multiple '
                            f'batch sizes {set(batch_sizes)} for the given input: \n'
                            f'{ff}')
@@ -971,11 +994,13 @@ class Network(Node):
       # check feedback consistency
       for k, size in self._feedback_shapes.items():
         assert k in fb, f"The required key {k} is not provided in feedback inputs."
-        check_batch_shape(size, fb[k].shape)
+        if not check_batch_shape(size, fb[k].shape, mode='bool'):
+          raise ValueError(f'Feedback size {fb[k].shape} is not consistent with '
+                           f'the feedback size {size}')
 
     # data transformation
     ff = self.data_pass_func(ff)
-    fb = self.data_pass_func(fb)
+    fb = None if fb is None else self.data_pass_func(fb)
     return ff, fb
 
   def _call(self,
@@ -1061,50 +1086,26 @@ class Network(Node):
     Tensor
       A output tensor value, or a dict of output tensors.
     """
-    all_nodes = set([n.name for n in self.lnodes])
-    runned_nodes = set()
-    output_nodes = set([n.name for n in self.exit_nodes])
-
     # initialize the feedback
     if forced_feedbacks is None: forced_feedbacks = dict()
     if monitors is None: monitors = dict()
 
-    # initialize the data
-    children_queue = []
-    ff_senders, _ = find_senders_and_receivers(self.ff_edges)
-
     # initialize the parent output data
     parent_outputs = {}
     for i, node in enumerate(self._entry_nodes):
       ff_ = {node.name: ff[i]}
       fb_ = {p: (forced_feedbacks[p.name] if (p.name in forced_feedbacks) else p.feedback())
              for p in self.fb_senders.get(node, [])}
-      self._call_a_node(node, ff_, fb_, monitors, forced_states,
-                        parent_outputs, children_queue, ff_senders, **kwargs)
-      runned_nodes.add(node.name)
+      self._call_a_node(node, ff_, fb_, monitors, forced_states, parent_outputs, **kwargs)
 
     # run the model
-    while len(children_queue):
-      node = children_queue.pop(0)
+    for node in self._ff_order:
       # get feedforward and feedback inputs
       ff = {p: parent_outputs[p] for p in self.ff_senders.get(node, [])}
       fb = {p: (forced_feedbacks[p.name] if (p.name in forced_feedbacks) else p.feedback())
             for p in self.fb_senders.get(node, [])}
       # call the node
-      self._call_a_node(node, ff, fb, monitors, forced_states,
-                        parent_outputs, children_queue, ff_senders,
-                        **kwargs)
-
-      # #- remove unnecessary parent outputs -#
-      # needed_parents = []
-      # runned_nodes.add(node.name)
-      # for child in (all_nodes - runned_nodes):
-      #   for parent in self.ff_senders[self.implicit_nodes[child]]:
-      #     needed_parents.append(parent.name)
-      # for parent in list(parent_outputs.keys()):
-      #   _name = parent.name
-      #   if _name not in needed_parents and _name not in output_nodes:
-      #     parent_outputs.pop(parent)
+      self._call_a_node(node, ff, fb, monitors, forced_states, parent_outputs, **kwargs)
 
     # returns
     if len(self.exit_nodes) > 1:
@@ -1114,7 +1115,7 @@ class Network(Node):
     return state, monitors
 
   def _call_a_node(self, node, ff, fb, monitors, forced_states,
-                   parent_outputs, children_queue, ff_senders, **kwargs):
+                   parent_outputs, **kwargs):
     ff = node.data_pass_func(ff)
     if f'{node.name}.inputs' in monitors:
       monitors[f'{node.name}.inputs'] = ff
@@ -1133,11 +1134,6 @@ class Network(Node):
       monitors[f'{node.name}.state'] = node.state.value
     if f'{node.name}.output' in monitors:
       monitors[f'{node.name}.output'] = parent_outputs[node]
-    # append children nodes
-    for child in self.ff_receivers.get(node, []):
-      ff_senders[child].remove(node)
-      if len(ff_senders.get(child, [])) == 0:
-        children_queue.append(child)
 
   def plot_node_graph(self,
                       fig_size: tuple = (10, 10),
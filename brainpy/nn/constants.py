@@ -45,7 +45,7 @@ def _pass_only_one(data):
   if len(data) > 1:
     raise ValueError(f'"PASS_ONLY_ONE" type only support one '
                      f'feedforward/feedback input. But we got {len(data)}.')
-  return tuple(data.values())[0]
+  return next(iter(data.values()))
 
 
 def _pass_sequence(data):
@@ -126,57 +126,53 @@ def detect_cycle(nodes, edges):
 
 def _has_path_by_dfs(from_node, to_node, graph):
   # queue本质上是堆栈，用来存放需要进行遍历的数据
-  # order里面存放的是具体的访问路径
-  queue, order = [], []
-  # 首先将初始遍历的节点放到queue中，表示将要从这个点开始遍历
-  queue.append(from_node)
+  # visited里面存放的是所有已经压入过堆栈的节点，用集合以常数时间判断是否访问过
+  queue, visited = [from_node], {from_node}
   while len(queue):
-    # 从queue中pop出点v，然后从v点开始遍历了，所以可以将这个点pop出，然后将其放入order中
-    # 这里才是最有用的地方，pop（）表示弹出栈顶，由于下面的for循环不断的访问子节点，并将子节点压入堆栈，
+    # pop（）表示弹出栈顶，由于下面的for循环不断的访问子节点，并将子节点压入堆栈，
     # 也就保证了每次的栈顶弹出的顺序是下面的节点
     v = queue.pop()
-    order.append(v)
     # 这里开始遍历v的子节点
-    for w in graph[v]:
-      # w既不属于queue也不属于order，意味着这个点没被访问过，所以讲起放到queue中，然后后续进行访问
-      if w not in order and w not in queue:
+    for w in graph.get(v, ()):
+      # w没有被访问过，所以将其放到queue中，然后后续进行访问
+      if w not in visited:
         if w == to_node:
           return True
-        else:
-          queue.append(w)
+        visited.add(w)
+        queue.append(w)
   return False
 
 
 def _has_path_by_bfs(from_node, to_node, graph):
-  # queue本质上是堆栈，用来存放需要进行遍历的数据
-  # order里面存放的是具体的访问路径
-  queue, order = [], []
-  # 首先将初始遍历的节点放到queue中，表示将要从这个点开始遍历
-  # 由于是广度优先，也就是先访问初始节点的所有的子节点，所以可以
-  queue.append(from_node)
-  order.append(from_node)
+  # queue是先进先出的队列，visited里面存放的是所有已经访问过的节点
+  queue, visited = deque([from_node]), {from_node}
   while len(queue):
-    # queue.pop(0)意味着是队列的方式出元素，就是先进先出，而下面的for循环将节点v的所有子节点
-    # 放到queue中，所以queue.pop(0)就实现了每次访问都是先将元素的子节点访问完毕，而不是优先叶子节点
-    v = queue.pop(0)
-    for w in graph[v]:
-      if w not in order:
+    # queue.popleft()意味着是队列的方式出元素，就是先进先出，而下面的for循环将节点v的所有子节点
+    # 放到queue中，所以每次访问都是先将元素的子节点访问完毕，而不是优先叶子节点
+    v = queue.popleft()
+    for w in graph.get(v, ()):
+      if w not in visited:
         if w == to_node:
           return True
-        else:
-          # 这里可以直接order.append(w) 因为广度优先就是先访问节点的所有下级子节点，所以可以
-          # 将self.sequense[v]的值直接全部先给到order
-          order.append(w)
-          queue.append(w)
+        visited.add(w)
+        queue.append(w)
   return False
 
 
 def detect_path(from_node, to_node, edges, method='dfs'):
   """Detect whether there is a path exist in the defined graph
-  from ``from_node`` to ``to_node``. """
-  graph = defaultdict(list)
-  for s, r in edges:
-    graph[s].append(r)
+  from ``from_node`` to ``to_node``.
+
+  ``edges`` can be a sequence of ``(sender, receiver)`` pairs, or a dict
+  which maps every sender to its receivers. The latter can be built once
+  and reused when several paths are detected in the same graph.
+  """
+  if isinstance(edges, dict):
+    graph = edges
+  else:
+    graph = defaultdict(list)
+    for s, r in edges:
+      graph[s].append(r)
   if method == 'dfs':
     return _has_path_by_dfs(from_node, to_node, graph)
   elif method == 'bfs':
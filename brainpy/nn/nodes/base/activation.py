@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from functools import partial
 from typing import Dict, Optional, Any
 
 from brainpy.math import activations
@@ -36,9 +37,10 @@ class Activation(Node):
     self._activation = activations.get(activation)
     self._fun_setting = dict() if (fun_setting is None) else fun_setting
     assert isinstance(self._fun_setting, dict), '"fun_setting" must be a dict.'
+    self._fun = partial(self._activation, **self._fun_setting)
 
   def init_ff(self):
     self.set_output_shape(self.feedforward_shapes)
 
   def forward(self, ff, **kwargs):
-    return self._activation(ff, **self._fun_setting)
+    return self._fun(ff)
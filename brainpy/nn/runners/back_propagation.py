@@ -236,10 +236,10 @@ class BPTT(RNNTrainer):
   def f_loss(self):
     if self._f_loss_public is None:
       self._f_loss_public = self._get_f_loss()
-    if self.jit:
-      dyn_vars = self.target.vars()
-      dyn_vars.update(self.dyn_vars)
-      self._f_loss_public = bm.jit(self._f_loss_public, dyn_vars=dyn_vars)
+      if self.jit:
+        dyn_vars = self.target.vars()
+        dyn_vars.update(self.dyn_vars)
+        self._f_loss_public = bm.jit(self._f_loss_public, dyn_vars=dyn_vars.unique())
     return self._f_loss_public
 
   @property
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+
+import unittest
+import brainpy as bp
+import brainpy.math as bm
+
+
+class TestNodeInitialize(unittest.TestCase):
+  def test_consistent_batch_sizes(self):
+    node = bp.nn.Dense(3)
+    node.initialize(bm.ones((2, 4)))
+    self.assertEqual(node.output_shape, (None, 3))
+
+  def test_inconsistent_batch_sizes(self):
+    node = bp.nn.Dense(3)
+    with self.assertRaises(ValueError):
+      node.initialize({node.name: bm.ones((2, 4)), 'other': bm.ones((3, 4))})
+
+  def test_feedforward_shapes_not_shared(self):
+    class NameDictDense(bp.nn.Dense):
+      data_pass_type = bp.nn.PASS_NAME_DICT
+
+    node = NameDictDense(3, input_shape=4)
+    node.feedforward_shapes[node.name] = (None, 5)
+    self.assertEqual(node.feedforward_shapes, {node.name: (None, 4)})
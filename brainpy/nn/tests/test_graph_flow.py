@@ -4,6 +4,7 @@
 import unittest
 from brainpy.nn.graph_flow import find_entries_and_exits
 from brainpy.nn.graph_flow import detect_cycle
+from brainpy.nn.graph_flow import detect_path
 
 
 class TestGraphFlow(unittest.TestCase):
@@ -69,3 +70,18 @@ class TestDetectCycle(unittest.TestCase):
     nodes = [0, 1, 2, 3]
     edges = [(0, 1), (0, 2), (1, 2), (2, 0), (2, 3), (3, 3)]
     print(detect_cycle(nodes, edges))
+
+
+class TestDetectPath(unittest.TestCase):
+  def test_edges(self):
+    edges = ((1, 2), (2, 3), (3, 4), (5, 6))
+    for method in ['dfs', 'bfs']:
+      self.assertTrue(detect_path(1, 4, edges, method=method))
+      self.assertFalse(detect_path(4, 1, edges, method=method))
+      self.assertFalse(detect_path(1, 6, edges, method=method))
+
+  def test_receiver_dict(self):
+    graph = {1: [2, 5], 2: [3], 3: [4]}
+    for method in ['dfs', 'bfs']:
+      self.assertTrue(detect_path(1, 4, graph, method=method))
+      self.assertFalse(detect_path(5, 4, graph, method=method))
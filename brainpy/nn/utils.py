@@ -22,13 +22,15 @@ def tensor_sum(values: Union[Sequence[Tensor], Dict[Any, Tensor], Tensor]):
   if isinstance(values, (bm.ndarray, jnp.ndarray)):
     return values
   if isinstance(values, dict):
-    values = list(values.values())
+    values = iter(values.values())
   elif isinstance(values, (tuple, list)):
-    values = list(values)
+    values = iter(values)
   else:
     raise ValueError('Unknown types of tensors.')
-  res = values[0]
-  for v in values[1:]:
+  res = next(values, None)
+  if res is None:
+    raise ValueError('tensor_sum() requires at least one tensor')
+  for v in values:
     res = res + v
   return res
 
@@ -48,16 +50,14 @@ def init_param(param: Union[Callable, Initializer, bm.ndarray, jnp.ndarray],
   size: int, sequence of int
     The shape of the parameter.
   """
-  size = to_size(size)
   if param is None:
     return None
-  elif callable(param):
+  size = to_size(size)
+  if callable(param):
     param = param(size)
   elif isinstance(param, (onp.ndarray, jnp.ndarray)):
     param = bm.asarray(param)
-  elif isinstance(param, (bm.JaxArray,)):
-    param = param
-  else:
+  elif not isinstance(param, bm.JaxArray):
     raise ValueError(f'Unknown param type {type(param)}: {param}')
   assert param.shape == size, f'"param.shape" is not the required size {size}'
   return param
@@ -5,7 +5,7 @@ import jax.numpy as jnp
 from brainpy.base.base import Base
 from brainpy.errors import MathError
 from brainpy.math import numpy_ops as ops
-from brainpy.math.jaxarray import Variable
+from brainpy.math.jaxarray import JaxArray, Variable
 
 __all__ = [
   # schedulers
@@ -44,6 +44,12 @@ class Scheduler(Base):
   def update(self):
     self.step += 1
 
+  def _get_step(self, i=None):
+    # the step as a JAX value, whether it is the current step,
+    # a Python number, a JAX array or a brainpy JaxArray
+    i = self.step[0] if i is None else i
+    return i.value if isinstance(i, JaxArray) else i
+
   def __call__(self, i=None):
     raise NotImplementedError
 
@@ -60,7 +66,7 @@ class ExponentialDecay(Scheduler):
     self.decay_rate = decay_rate
 
   def __call__(self, i=None):
-    i = self.step[0] if i is None else i
+    i = self._get_step(i)
     return self.lr * self.decay_rate ** (i / self.decay_steps)
 
 
@@ -70,9 +76,9 @@ class InverseTimeDecay(ExponentialDecay):
     self.staircase = staircase
 
   def __call__(self, i=None):
-    i = self.step[0] if i is None else i
+    i = self._get_step(i)
     if self.staircase:
-      return self.lr / (1 + self.decay_rate * ops.floor(i / self.decay_steps).value)
+      return self.lr / (1 + self.decay_rate * jnp.floor(i / self.decay_steps))
     else:
       return self.lr / (1 + self.decay_rate * i / self.decay_steps)
 
@@ -85,8 +91,8 @@ class PolynomialDecay(Scheduler):
     self.power = power
 
   def __call__(self, i=None):
-    i = self.step[0] if i is None else i
-    i = ops.minimum(i, self.decay_steps).value
+    i = self._get_step(i)
+    i = jnp.minimum(i, self.decay_steps)
     step_mult = (1 - i / self.decay_steps) ** self.power
     return step_mult * (self.lr - self.final_lr) + self.final_lr
 
@@ -101,9 +107,12 @@ class PiecewiseConstant(Scheduler):
       raise MathError("boundaries and values must be sequences")
     if not boundaries.shape[0] == values.shape[0] - 1:
       raise MathError("boundaries length must be one shorter than values length")
+    if not bool(jnp.all(boundaries[1:] >= boundaries[:-1])):
+      raise MathError("boundaries must be sorted in increasing order")
     self.boundaries = boundaries
     self.values = values
 
   def __call__(self, i=None):
-    i = self.step[0] if i is None else i
-    return self.values[ops.sum(i > self.boundaries)]
+    i = self._get_step(i)
+    # the number of boundaries smaller than "i", found by a binary search
+    return self.values[jnp.searchsorted(self.boundaries, i, side='left')]
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import brainpy as bp
+import brainpy.math as bm
+
+
+class TestScheduler(unittest.TestCase):
+  def test_exponential_decay(self):
+    s = bp.optim.ExponentialDecay(0.1, decay_steps=10, decay_rate=0.5)
+    self.assertAlmostEqual(float(s()), 0.1)
+    s.update()
+    self.assertAlmostEqual(float(s()), 0.1 * 0.5 ** 0.1, places=6)
+    r = s(bm.asarray(10))
+    self.assertNotIsInstance(r, bm.JaxArray)
+    self.assertAlmostEqual(float(r), 0.05, places=6)
+
+  def test_inverse_time_decay(self):
+    s = bp.optim.InverseTimeDecay(0.1, decay_steps=10, decay_rate=1., staircase=True)
+    self.assertAlmostEqual(float(s()), 0.1)
+    r = s(bm.asarray(15))
+    self.assertNotIsInstance(r, bm.JaxArray)
+    self.assertAlmostEqual(float(r), 0.05, places=6)
+    s = bp.optim.InverseTimeDecay(0.1, decay_steps=10, decay_rate=1.)
+    r = s(bm.asarray(15))
+    self.assertNotIsInstance(r, bm.JaxArray)
+    self.assertAlmostEqual(float(r), 0.04, places=6)
+
+  def test_polynomial_decay(self):
+    s = bp.optim.PolynomialDecay(0.1, decay_steps=10, final_lr=0.01)
+    self.assertAlmostEqual(float(s()), 0.1, places=6)
+    self.assertAlmostEqual(float(s(bm.asarray(3))), 0.073, places=6)
+    self.assertAlmostEqual(float(s(20)), 0.01, places=6)
+
+  def test_piecewise_constant(self):
+    s = bp.optim.PiecewiseConstant([5, 10], [0.1, 0.01, 0.001])
+    self.assertAlmostEqual(float(s()), 0.1, places=6)
+    self.assertAlmostEqual(float(s(5)), 0.1, places=6)
+    self.assertAlmostEqual(float(s(bm.asarray(6))), 0.01, places=6)
+    self.assertAlmostEqual(float(s(bm.asarray(11))), 0.001, places=6)
+    with self.assertRaises(bp.errors.MathError):
+      bp.optim.PiecewiseConstant([10, 5], [0.1, 0.01, 0.001])
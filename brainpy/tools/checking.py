@@ -22,15 +22,33 @@ __all__ = [
   'check_string',
 ]
 
+_tensor_types = None
+
+
+def _get_tensor_types():
+  # "brainpy.math" imports this module, so the tensor types
+  # are resolved at the first call rather than at import time
+  global _tensor_types
+  if _tensor_types is None:
+    import brainpy.math as bm
+    _tensor_types = (bm.ndarray, jnp.ndarray)
+  return _tensor_types
+
 
 def check_shape_consistency(shapes, free_axes=None, return_format_shapes=False):
   assert isinstance(shapes, (tuple, list)), f'Must be a sequence of shape. While we got {shapes}.'
   for shape in shapes:
     assert isinstance(shapes, (tuple, list)), (f'Must be a sequence of shape. While '
                                                f'we got one element is {shape}.')
-  dims = onp.unique([len(shape) for shape in shapes])
+  # identical shapes without free axes need no further checking
+  if free_axes is None and len(shapes) and all(s == shapes[0] for s in shapes[1:]):
+    if return_format_shapes:
+      return tuple(shapes[0]), None
+    return
+  dims = {len(shape) for shape in shapes}
   if len(dims) > 1:
     raise ValueError(f'The provided shape dimensions are not consistent. ')
+  ndim = dims.pop()
   if free_axes is None:
     type_ = 'none'
     free_axes = ()
@@ -42,19 +60,21 @@ def check_shape_consistency(shapes, free_axes=None, return_format_shapes=False):
     free_axes = (free_axes,)
   else:
     raise ValueError
-  free_axes = [(dims[0] + axis if axis < 0 else axis) for axis in free_axes]
-  all_shapes = []
+  free_axes = [(ndim + axis if axis < 0 else axis) for axis in free_axes]
+  free_axes_set = frozenset(free_axes)
+  unique_shape = None
   for shape in shapes:
     assert isinstance(shapes, (tuple, list)), (f'Must be a sequence of shape. While '
                                                f'we got one element is {shape}.')
-    shape = tuple([sh for i, sh in enumerate(shape) if i not in free_axes])
-    all_shapes.append(shape)
-  unique_shape = tuple(set(all_shapes))
-  if len(unique_shape) > 1:
-    if len(free_axes):
-      raise ValueError(f'The provided shape (without axes of {free_axes}) are not consistent.')
-    else:
-      raise ValueError(f'The provided shape are not consistent.')
+    shape = tuple(sh for i, sh in enumerate(shape) if i not in free_axes_set)
+    # compare with the first shape, and stop at the first mismatch
+    if unique_shape is None:
+      unique_shape = shape
+    elif shape != unique_shape:
+      if len(free_axes):
+        raise ValueError(f'The provided shape (without axes of {free_axes}) are not consistent.')
+      else:
+        raise ValueError(f'The provided shape are not consistent.')
   if return_format_shapes:
     if type_ == 'int':
       free_shapes = tuple([shape[free_axes[0]] for shape in shapes])
@@ -62,7 +82,7 @@ def check_shape_consistency(shapes, free_axes=None, return_format_shapes=False):
       free_shapes = tuple([tuple([shape[axis] for axis in free_axes]) for shape in shapes])
     else:
       free_shapes = None
-    return unique_shape[0], free_shapes
+    return unique_shape, free_shapes
 
 
 def check_shape_broadcastable(shapes, free_axes=(), return_format_shapes=False):
@@ -82,7 +102,8 @@ def check_shape_broadcastable(shapes, free_axes=(), return_format_shapes=False):
 
   """
   max_dim = max([len(shape) for shape in shapes])
-  shapes = [[1] * (max_dim - len(s)) + list(s) for s in shapes]
+  ones = (1,) * max_dim
+  shapes = [ones[len(s):] + tuple(s) for s in shapes]
   return check_shape_consistency(shapes, free_axes, return_format_shapes)
 
 
@@ -95,11 +116,11 @@ def check_batch_shape(shape1, shape2, batch_idx=0, mode='raise'):
                        f'{shape1} != {shape2}')
     else:
       return False
-  new_shape1 = list(shape1)
-  new_shape2 = list(shape2)
-  new_shape1.pop(batch_idx)
-  new_shape2.pop(batch_idx)
-  if new_shape1 != new_shape2:
+  # compare the tuples without the batch axis ("tuple()" does
+  # not copy a tuple, and makes lists comparable with tuples)
+  shape1, shape2 = tuple(shape1), tuple(shape2)
+  i = batch_idx + len(shape1) if batch_idx < 0 else batch_idx
+  if shape1[:i] + shape1[i + 1:] != shape2[:i] + shape2[i + 1:]:
     if mode == 'raise':
       raise ValueError(f'Two shapes {shape1} and {shape2} are not '
                        f'consistent when excluding the batch axis '
@@ -119,7 +140,8 @@ def check_shape(all_shapes, free_axes: Union[Sequence[int], int] = -1):
     raise ValueError
   # maximum number of dimension
   max_dim = max([len(shape) for shape in all_shapes])
-  all_shapes = [[1] * (max_dim - len(s)) + list(s) for s in all_shapes]
+  ones = (1,) * max_dim
+  all_shapes = [ones[len(s):] + tuple(s) for s in all_shapes]
   # check "free_axes"
   type_ = 'seq'
   if isinstance(free_axes, int):
@@ -129,21 +151,32 @@ def check_shape(all_shapes, free_axes: Union[Sequence[int], int] = -1):
     free_axes = tuple(free_axes)
   assert isinstance(free_axes, tuple)
   free_axes = [(axis + max_dim if axis < 0 else axis) for axis in free_axes]
-  fixed_axes = [i for i in range(max_dim) if i not in free_axes]
-  # get all free shapes
+  free_axes_set = frozenset(free_axes)
+  fixed_axes = [i for i in range(max_dim) if i not in free_axes_set]
+  # get all free shapes, which may contain "None" (such as the batch size)
   if type_ == 'int':
     free_shape = [shape[free_axes[0]] for shape in all_shapes]
   else:
     free_shape = [[shape[axis] for axis in free_axes] for shape in all_shapes]
   # get all assumed fixed shapes
-  fixed_shapes = [[shape[axis] for shape in all_shapes] for axis in fixed_axes]
-  max_fixed_shapes = [max(shape) for shape in fixed_shapes]
+  fixed_shapes = [[shape[axis] for axis in fixed_axes] for shape in all_shapes]
+  if all(type(sh) is int for shape in fixed_shapes for sh in shape):
+    # check them as one (num_shape, num_fixed_axis) integer array
+    fixed_shapes = onp.asarray(fixed_shapes, dtype=onp.int64)
+    max_fixed_shapes = fixed_shapes.max(axis=0)
+    compatible = onp.all((fixed_shapes == 1) | (fixed_shapes == max_fixed_shapes))
+    max_fixed_shapes = max_fixed_shapes.tolist()
+  else:
+    # shapes with unknown (such as "None") dimensions are checked per axis
+    fixed_shapes = list(zip(*fixed_shapes))
+    max_fixed_shapes = [max(shape) for shape in fixed_shapes]
+    compatible = all(len(set(shape) - {1, max_fixed_shapes[i]}) == 0
+                     for i, shape in enumerate(fixed_shapes))
   # check whether they can broadcast compatible
-  for i, shape in enumerate(fixed_shapes):
-    if len(set(shape) - {1, max_fixed_shapes[i]}):
-      raise ValueError(f'Shapes out of axes {free_axes} are not '
-                       f'broadcast compatible: \n'
-                       f'{all_shapes}')
+  if not compatible:
+    raise ValueError(f'Shapes out of axes {free_axes} are not '
+                     f'broadcast compatible: \n'
+                     f'{all_shapes}')
   return free_shape, max_fixed_shapes
 
 
@@ -167,8 +200,6 @@ def check_initializer(initializer: Union[Callable, init.Initializer, Tensor],
                       allow_none=False):
   """Check the initializer.
   """
-  import brainpy.math as bm
-
   name = '' if name is None else name
   if initializer is None:
     if allow_none:
@@ -177,7 +208,7 @@ def check_initializer(initializer: Union[Callable, init.Initializer, Tensor],
       raise ValueError(f'{name} must be an initializer, but we got None.')
   if isinstance(initializer, init.Initializer):
     return
-  elif isinstance(initializer, (bm.ndarray, jnp.ndarray)):
+  elif isinstance(initializer, _get_tensor_types()):
     return
   elif callable(initializer):
     return
@@ -190,8 +221,6 @@ def check_connector(connector: Union[Callable, conn.Connector, Tensor],
                     name: str = None, allow_none=False):
   """Check the connector.
   """
-  import brainpy.math as bm
-
   name = '' if name is None else name
   if connector is None:
     if allow_none:
@@ -200,7 +229,7 @@ def check_connector(connector: Union[Callable, conn.Connector, Tensor],
       raise ValueError(f'{name} must be an initializer, but we got None.')
   if isinstance(connector, conn.Connector):
     return
-  elif isinstance(connector, (bm.ndarray, jnp.ndarray)):
+  elif isinstance(connector, _get_tensor_types()):
     return
   elif callable(connector):
     return
@@ -209,6 +238,25 @@ def check_connector(connector: Union[Callable, conn.Connector, Tensor],
                      f'tensor or callable function. While we got {type(connector)}')
 
 
+def _check_numeric(value, types, type_name, name, min_bound, max_bound, allow_none):
+  if name is None: name = ''
+  if value is None:
+    if allow_none:
+      return
+    else:
+      raise ValueError(f'{name} must be {type_name}, but got None')
+  if not isinstance(value, types):
+    raise ValueError(f'{name} must be {type_name}, but got {type(value)}')
+  if min_bound is not None:
+    if value < min_bound:
+      raise ValueError(f"{name} must be {type_name} bigger than {min_bound}, "
+                       f"while we got {value}")
+  if max_bound is not None:
+    if value > max_bound:
+      raise ValueError(f"{name} must be {type_name} smaller than {max_bound}, "
+                       f"while we got {value}")
+
+
 def check_float(value: float, name=None, min_bound=None, max_bound=None,
                 allow_none=False, allow_int=True):
   """Check float type.
@@ -226,26 +274,8 @@ def check_float(value: float, name=None, min_bound=None, max_bound=None,
   allow_int: bool
     Whether allow the value be an integer.
   """
-  if name is None: name = ''
-  if value is None:
-    if allow_none:
-      return
-    else:
-      raise ValueError(f'{name} must be a float, but got None')
-  if allow_int:
-    if not isinstance(value, (float, int)):
-      raise ValueError(f'{name} must be a float, but got {type(value)}')
-  else:
-    if not isinstance(value, float):
-      raise ValueError(f'{name} must be a float, but got {type(value)}')
-  if min_bound is not None:
-    if value < min_bound:
-      raise ValueError(f"{name} must be a float bigger than {min_bound}, "
-                       f"while we got {value}")
-  if max_bound is not None:
-    if value > max_bound:
-      raise ValueError(f"{name} must be a float smaller than {max_bound}, "
-                       f"while we got {value}")
+  _check_numeric(value, (float, int) if allow_int else float, 'a float',
+                 name, min_bound, max_bound, allow_none)
 
 
 def check_integer(value: int, name=None, min_bound=None, max_bound=None, allow_none=False):
@@ -262,22 +292,7 @@ def check_integer(value: int, name=None, min_bound=None, max_bound=None, allow_n
   allow_none: bool
     Whether allow the value is None.
   """
-  if name is None: name = ''
-  if value is None:
-    if allow_none:
-      return
-    else:
-      raise ValueError(f'{name} must be an int, but got None')
-  if not isinstance(value, int):
-    raise ValueError(f'{name} must be an int, but got {type(value)}')
-  if min_bound is not None:
-    if value < min_bound:
-      raise ValueError(f"{name} must be an int bigger than {min_bound}, "
-                       f"while we got {value}")
-  if max_bound is not None:
-    if value > max_bound:
-      raise ValueError(f"{name} must be an int smaller than {max_bound}, "
-                       f"while we got {value}")
+  _check_numeric(value, int, 'an int', name, min_bound, max_bound, allow_none)
 
 
 def check_string(value: str, name: str = None, candidates: Sequence[str] = None, allow_none=False):
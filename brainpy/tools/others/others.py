@@ -18,12 +18,13 @@ __all__ = [
 
 
 def size2num(size):
-  if isinstance(size, int):
-    return size
+  # always return a Python int, even the size is given by NumPy integers
+  if isinstance(size, (int, np.integer)):
+    return int(size)
   elif isinstance(size, (tuple, list)):
     a = 1
     for b in size:
-      a *= b
+      a *= int(b)
     return a
   else:
     raise ValueError(f'Do not support type {type(size)}: {size}')
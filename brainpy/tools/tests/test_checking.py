@@ -49,3 +49,25 @@ class TestUtils(unittest.TestCase):
     ]
     with self.assertRaises(ValueError):
       free_shape, fixed_shapes = checking.check_shape(all_shapes, free_axes=[0, -1])
+
+  def test_check_numeric(self):
+    checking.check_float(1, 'a', min_bound=0.)
+    checking.check_integer(2, 'b', min_bound=1)
+    with self.assertRaises(ValueError):
+      checking.check_float(1, 'a', allow_int=False)
+    with self.assertRaises(ValueError):
+      checking.check_integer(0, 'b', min_bound=1)
+
+  def test_check_shape_none_batch(self):
+    all_shapes = [
+      (None, 10, 3),
+      (None, 20, 3)
+    ]
+    free_shape, fixed_shapes = checking.check_shape(all_shapes, free_axes=[0, 1])
+    self.assertEqual(free_shape, [[None, 10], [None, 20]])
+    self.assertEqual(fixed_shapes, [3])
+
+  def test_check_shape_none_fixed_dim(self):
+    free_shape, fixed_shapes = checking.check_shape([(None, 10, 3)], free_axes=-1)
+    self.assertEqual(free_shape, [3])
+    self.assertEqual(fixed_shapes, [None, 10])
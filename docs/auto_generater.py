@@ -9,14 +9,14 @@ from brainpy.math import (activations, autograd, controls, function,
                           compact)
 
 
-block_list = ['test', 'register_pytree_node']
+block_list = {'test', 'register_pytree_node'}
 for module in [jit, autograd, function,
                controls, activations,
                operators, parallels, setting,
                delay_vars, compact]:
-  for k in dir(module):
-    if (not k.startswith('_')) and (not inspect.ismodule(getattr(module, k))):
-      block_list.append(k)
+  for k, data in vars(module).items():
+    if (not k.startswith('_')) and (not inspect.ismodule(data)):
+      block_list.add(k)
 
 
 def get_class_funcs(module):
@@ -39,78 +39,60 @@ def get_class_funcs(module):
   return classes, functions, others
 
 
-def write_module(module_name, filename, header=None):
-  module = importlib.import_module(module_name)
-  classes, functions, others = get_class_funcs(module)
+def _autosummary_lines(functions, classes, others):
+  lines = ['.. autosummary::\n', '   :toctree: generated/\n\n']
+  lines.extend(f'   {m}\n' for m in functions + classes + others)
+  return lines
+
 
-  fout = open(filename, 'w')
-  # write header
+def _header_lines(module_name, header=None):
   if header is None:
     header = f'``{module_name}`` module'
-  else:
-    header = header
-  fout.write(header + '\n')
-  fout.write('=' * len(header) + '\n\n')
-  fout.write(f'.. currentmodule:: {module_name} \n')
-  fout.write(f'.. automodule:: {module_name} \n\n')
+  return [header + '\n',
+          '=' * len(header) + '\n\n',
+          f'.. currentmodule:: {module_name} \n',
+          f'.. automodule:: {module_name} \n\n']
+
 
-  # write autosummary
-  fout.write('.. autosummary::\n')
-  fout.write('   :toctree: generated/\n\n')
-  for m in functions:
-    fout.write(f'   {m}\n')
-  for m in classes:
-    fout.write(f'   {m}\n')
-  for m in others:
-    fout.write(f'   {m}\n')
+def write_module(module_name, filename, header=None):
+  module = importlib.import_module(module_name)
+  classes, functions, others = get_class_funcs(module)
 
-  fout.close()
+  # the whole file is collected first, and then written at once
+  lines = _header_lines(module_name, header)
+  lines.extend(_autosummary_lines(functions, classes, others))
+  with open(filename, 'w') as fout:
+    fout.write(''.join(lines))
 
 
 def write_submodules(module_name, filename, header=None, submodule_names=(), section_names=()):
-  fout = open(filename, 'w')
-  # write header
-  if header is None:
-    header = f'``{module_name}`` module'
-  else:
-    header = header
-  fout.write(header + '\n')
-  fout.write('=' * len(header) + '\n\n')
-  fout.write(f'.. currentmodule:: {module_name} \n')
-  fout.write(f'.. automodule:: {module_name} \n\n')
+  lines = _header_lines(module_name, header)
 
   # whole module
   for i, name in enumerate(submodule_names):
     module = importlib.import_module(module_name + '.' + name)
     classes, functions, others = get_class_funcs(module)
 
-    fout.write(section_names[i] + '\n')
-    fout.write('-' * len(section_names[i]) + '\n\n')
-
-    # write autosummary
-    fout.write('.. autosummary::\n')
-    fout.write('   :toctree: generated/\n\n')
-    for m in functions:
-      fout.write(f'   {m}\n')
-    for m in classes:
-      fout.write(f'   {m}\n')
-    for m in others:
-      fout.write(f'   {m}\n')
-
-    fout.write(f'\n\n')
+    lines.append(section_names[i] + '\n')
+    lines.append('-' * len(section_names[i]) + '\n\n')
+    lines.extend(_autosummary_lines(functions, classes, others))
+    lines.append(f'\n\n')
 
-  fout.close()
+  with open(filename, 'w') as fout:
+    fout.write(''.join(lines))
 
 
 def _get_functions(obj):
-  return set([n for n in dir(obj)
-              if (n not in block_list  # not in blacklist
-                  and callable(getattr(obj, n))  # callable
-                  and not isinstance(getattr(obj, n), type)  # not class
-                  and n[0].islower()  # starts with lower char
-                  and not n.startswith('__')  # not special methods
-                  )
-              ])
+  functions = set()
+  for n in dir(obj):
+    if (n in block_list  # in blacklist
+        or not n[0].islower()  # not starts with lower char
+        or n.startswith('__')):  # special methods
+      continue
+    data = getattr(obj, n)
+    if callable(data) and not isinstance(data, type):  # callable, but not class
+      functions.add(n)
+  return functions
 
 
 def _import(mod, klass):
@@ -27,7 +27,7 @@ setup(
   author='BrainPy Team',
   author_email='chao.brain@qq.com',
   packages=find_packages(),
-  python_requires='>=3.6',
+  python_requires='>=3.7',
   install_requires=[
     'numpy>=1.15',
     'jax>=0.2.10',
@@ -46,7 +46,6 @@ setup(
     'Operating System :: OS Independent',
     'Programming Language :: Python',
     'Programming Language :: Python :: 3',
-    'Programming Language :: Python :: 3.6',
     'Programming Language :: Python :: 3.7',
     'Programming Language :: Python :: 3.8',
     'Programming Language :: Python :: 3.9',